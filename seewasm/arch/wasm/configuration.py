@@ -18,7 +18,11 @@ class bcolors:
 class Configuration:
     """
     The static class that maintain the user's input option
+
+    The fields are read directly, e.g., `Configuration._source_type`, in the
+    paths executed for each instruction to avoid the calls of getters.
     """
+    __slots__ = ()
     _source_type = 'c'              # the original source file's type
     _algo = 'dfs'                   # the traverse algorithm, default is dfs
     # _algo = 'bfs'
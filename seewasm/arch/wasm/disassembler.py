@@ -1,8 +1,6 @@
-from collections import namedtuple
-
 from seewasm.arch.wasm.decode import decode_module
 from seewasm.arch.wasm.instruction import WasmInstruction
-from seewasm.arch.wasm.wasm import Wasm
+from seewasm.arch.wasm.wasm import Wasm, _table
 from seewasm.core.function import Function
 from seewasm.core.utils import bytecode_to_bytes
 from seewasm.engine.disassembler import Disassembler
@@ -12,7 +10,29 @@ from wasm.formatter import format_instruction
 from wasm.modtypes import CodeSection
 from wasm.opcodes import OPCODE_MAP
 
-inst_namedtuple = namedtuple('Instruction', 'op imm len')
+
+class _Instruction:
+    """
+    The instruction passed to `format_instruction`, which only accesses the
+    `op` and `imm` attributes. It is lighter than a namedtuple.
+    """
+    __slots__ = ('op', 'imm', 'len')
+
+    def __init__(self, op, imm, length):
+        self.op = op
+        self.imm = imm
+        self.len = length
+
+
+# opcode:(mnemonic/name, imm_struct, pops, pushes, description)
+INVALID_OPCODE = ('INVALID', 0, 0, 0, 'Unknown opcode')
+# the single-byte opcodes are looked up in a flat table indexed by the opcode,
+# only the multi-byte (0xfc prefixed) ones fall back to the dict
+SINGLE_BYTE_OPCODE_TABLE = tuple(
+    _table.get(opcode_id, INVALID_OPCODE) for opcode_id in range(0x100))
+# the instructions with identical bytes share the same formatted operand,
+# e.g., `local.get 0` and `i32.const 0` are quite common
+_fmt_cache = {}
 
 
 class WasmDisassembler(Disassembler):
@@ -29,7 +49,8 @@ class WasmDisassembler(Disassembler):
 
         bytecode_wnd = memoryview(bytecode)
         bytecode_idx = 0
-        opcode_id = byte2int(bytecode_wnd[bytecode_idx])
+        # indexing a memoryview of bytes gives the int directly
+        opcode_id = bytecode_wnd[bytecode_idx]
         opcode_size = 1
 
         bytecode_idx += 1
@@ -39,11 +60,11 @@ class WasmDisassembler(Disassembler):
                 opcode_size = 4
             elif opcode_id == 0xfc0b: # memory.fill
                 opcode_size = 3
-        # default value
-        # opcode:(mnemonic/name, imm_struct, pops, pushes, description)
-        invalid = ('INVALID', 0, 0, 0, 'Unknown opcode')
-        name, imm_struct, pops, pushes, description = \
-            self.asm.table.get(opcode_id, invalid)
+            name, imm_struct, pops, pushes, description = \
+                self.asm.table.get(opcode_id, INVALID_OPCODE)
+        else:
+            name, imm_struct, pops, pushes, description = \
+                SINGLE_BYTE_OPCODE_TABLE[opcode_id]
 
         operand_size = 0
         operand = None
@@ -53,10 +74,14 @@ class WasmDisassembler(Disassembler):
             assert not isinstance(imm_struct, int), f"imm_struct is int, most likely encountered unsupported inst.\nname: {name}\nimm_struct: {imm_struct}\npops: {pops} pushes: {pushes}\ndesc: {description}\nopcode_id: {hex(opcode_id)}"
             operand_size, operand, _ = imm_struct.from_raw(
                 None, bytecode_wnd[bytecode_idx:])
-            insn = inst_namedtuple(
-                OPCODE_MAP[opcode_id], operand, bytecode_idx + operand_size)
-            operand_interpretation = format_instruction(insn)
         insn_byte = bytecode_wnd[:bytecode_idx + operand_size].tobytes()
+        if imm_struct is not None:
+            operand_interpretation = _fmt_cache.get(insn_byte)
+            if operand_interpretation is None:
+                insn = _Instruction(
+                    OPCODE_MAP[opcode_id], operand, bytecode_idx + operand_size)
+                operand_interpretation = format_instruction(insn)
+                _fmt_cache[insn_byte] = operand_interpretation
         instruction = WasmInstruction(
             opcode_id, opcode_size, name, imm_struct, operand_size, insn_byte, pops, pushes,
             description, operand_interpretation=operand_interpretation,
@@ -78,6 +103,9 @@ class WasmDisassembler(Disassembler):
         :rtype: list, str, dict
         """
 
+        if bytecode:
+            # slicing a memoryview does not copy the rest of the bytecode
+            bytecode = memoryview(bytecode_to_bytes(bytecode))
         return super().disassemble(bytecode, offset, nature_offset, r_format)
 
     def extract_functions_code(self, module_bytecode):
@@ -96,7 +124,8 @@ class WasmDisassembler(Disassembler):
         if not code_data:
             raise ValueError('No functions/codes in the module')
         for idx, func in enumerate(code_data.payload.bodies):
-            instructions = self.disassemble(func.code.tobytes())
+            # the code is a memoryview of the module, no need to copy it out
+            instructions = self.disassemble(func.code)
             cur_function = Function(0, instructions[0])
             cur_function.instructions = instructions
 
@@ -3,7 +3,7 @@
 import logging
 import re
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
 from queue import Queue
 
 from z3 import BitVec, BitVecVal
@@ -46,6 +46,26 @@ else:
     logging_config['level'] = logging.WARNING
 logging.basicConfig(**logging_config)
 
+# the mapping from instruction's group to its emulation class
+INSTRUCTION_MAP = {
+    'Arithmetic_i32': ArithmeticInstructions,
+    'Arithmetic_i64': ArithmeticInstructions,
+    'Arithmetic_f32': ArithmeticInstructions,
+    'Arithmetic_f64': ArithmeticInstructions,
+    'Bitwise_i32': BitwiseInstructions,
+    'Bitwise_i64': BitwiseInstructions,
+    'Constant': ConstantInstructions,
+    'Control': ControlInstructions,
+    'Conversion': ConversionInstructions,
+    'Logical_i32': LogicalInstructions,
+    'Logical_i64': LogicalInstructions,
+    'Logical_f32': LogicalInstructions,
+    'Logical_f64': LogicalInstructions,
+    'Memory': MemoryInstructions,
+    'Parametric': ParametricInstructions,
+    'Variable': VariableInstructions,
+}
+
 
 # =======================================
 # #         WASM Emulator               #
@@ -309,7 +329,8 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
         state = WasmVMstate()
 
         # update file sys
-        state.file_sys[0]["content"] = Configuration.get_stdin()
+        # stdin is consumed from the left, see fd_read in wasi.py
+        state.file_sys[0]["content"] = deque(Configuration.get_stdin())
         sym_file_limit, _ = Configuration.get_sym_file_limits()
         for i in range(sym_file_limit):
             state.file_sys[i + 3] = init_file_for_file_sys()
@@ -343,6 +364,7 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
             states (list(VMstate)): From which the symbolic execution begin;
             instructions (list(Instruction)): A list of instruction objects
         """
+        emulate_one_instruction = self.emulate_one_instruction
         for instruction in instructions:
             if instruction.name == "unreachable":
                 stderr_msg = "got 'unreachable' instruction, now terminate\n"
@@ -351,41 +373,24 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
             next_states = []
             for state in states:  # TODO: embarassing parallel
                 state.instr = instruction
-                next_states.extend(self.emulate_one_instruction(
+                next_states.extend(emulate_one_instruction(
                     instruction, state, lvar))
             states = next_states
         return states
 
     def emulate_one_instruction(self, instr, state, lvar=None):
-        instruction_map = {
-            'Arithmetic_i32': ArithmeticInstructions,
-            'Arithmetic_i64': ArithmeticInstructions,
-            'Arithmetic_f32': ArithmeticInstructions,
-            'Arithmetic_f64': ArithmeticInstructions,
-            'Bitwise_i32': BitwiseInstructions,
-            'Bitwise_i64': BitwiseInstructions,
-            'Constant': ConstantInstructions,
-            'Control': ControlInstructions,
-            'Conversion': ConversionInstructions,
-            'Logical_i32': LogicalInstructions,
-            'Logical_i64': LogicalInstructions,
-            'Logical_f32': LogicalInstructions,
-            'Logical_f64': LogicalInstructions,
-            'Memory': MemoryInstructions,
-            'Parametric': ParametricInstructions,
-            'Variable': VariableInstructions,
-        }
         if instr.operand_interpretation is None:
             instr.operand_interpretation = instr.name
 
         # logging.debug(
         #     f"\nState:\t{id(state)}\nInstruction:\t{instr.operand_interpretation}\nOffset:\t\t{instr.nature_offset}\n{state.__str__()}")
 
-        instr_obj = instruction_map[instr.group](
+        group = instr.group
+        instr_obj = INSTRUCTION_MAP[group](
             instr.name, instr.operand, instr.operand_interpretation)
-        if instr.group == 'Memory':
+        if group == 'Memory':
             ret_states = instr_obj.emulate(state, self.data_section)
-        elif instr.group == 'Control':
+        elif group == 'Control':
             ret_states = instr_obj.emulate(
                 state, self.data_section, self.ana, lvar)
         else:
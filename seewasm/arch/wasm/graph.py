@@ -57,23 +57,29 @@ class Graph:
 
     Properties:
         _func_to_bbs: a mapping, from function's name to its included basic blocks (wrapped in a list);
+        _func_entry_bb: a mapping, from function's name to its entry basic block's name;
+        _bb_to_func: a mapping, from basic block's name to its belonging function's name;
         _bb_to_instructions: a mappming, from basic block's name to its included instruction objects (wrapped in a list);
         _aes_func: a mapping, not clear;
         _bbs_graph: a mapping, from basic block's name to a mapping, from edge type to its corresponding pointed to basic block's name;
         _rev_bbs_graph: same as above, but its reversed;
+        _bbs_succ: a mapping, from basic block's name to a tuple of (edge type, pointed to basic block's name), frozen from _bbs_graph after initialization;
         _workers: reserved, for multi-processing;
     """
     _func_to_bbs = defaultdict(list)
+    _func_entry_bb = {}
+    _bb_to_func = {}
     _bb_to_instructions = defaultdict(list)
     _aes_func = defaultdict(set)
-    _bbs_graph = defaultdict(lambda: defaultdict(str))  # nested dict
-    _rev_bbs_graph = defaultdict(lambda: defaultdict(str))
+    _bbs_graph = {}  # nested dict
+    _rev_bbs_graph = {}
+    _bbs_succ = {}
 
     _workers = 2
     _wasmVM = None
 
     def __init__(self):
-        self.entry = Configuration.get_entry()
+        self.entry = Configuration._entry_func
         self.final_states = {self.entry: None}
 
     @classproperty
@@ -84,6 +90,14 @@ class Graph:
     def func_to_bbs(cls):
         return cls._func_to_bbs
 
+    @classproperty
+    def func_entry_bb(cls):
+        return cls._func_entry_bb
+
+    @classproperty
+    def bb_to_func(cls):
+        return cls._bb_to_func
+
     @classproperty
     def bbs_graph(cls):
         return cls._bbs_graph
@@ -92,6 +106,10 @@ class Graph:
     def rev_bbs_graph(cls):
         return cls._rev_bbs_graph
 
+    @classproperty
+    def bbs_succ(cls):
+        return cls._bbs_succ
+
     @classproperty
     def bb_to_instructions(cls):
         return cls._bb_to_instructions
@@ -143,14 +161,15 @@ class Graph:
                 else:
                     # br_table case
                     numbered_edge_type = edge_type
-                cls.bbs_graph[node_from][numbered_edge_type] = node_to
+                cls.bbs_graph.setdefault(node_from, {})[
+                    numbered_edge_type] = node_to
                 type_ids[node_from][edge_type] += 1
 
             # append single nodes into the bbs_graph
             for bb in cfg.basicblocks:
                 bb_name = bb.name
                 if bb_name not in cls.bbs_graph:
-                    cls.bbs_graph[bb_name] = defaultdict(str)
+                    cls.bbs_graph[bb_name] = {}
 
         def init_bb_to_instr(cfg):
             """
@@ -179,7 +198,7 @@ class Graph:
                         target_func = cls.wasmVM.ana.func_prototypes[func_offset]
                         func_name, _, _, _ = target_func
                         readable_name = readable_internal_func_name(
-                            Configuration.get_func_index_to_func_name(), func_name)
+                            Configuration._func_index_to_func_name, func_name)
                         # aes function's name is generated in "name$index" format.
                         # some intrinsic functions starts with $, we should distinguish this situation
                         if readable_name[0] == '$':
@@ -200,7 +219,7 @@ class Graph:
                 out_degree = {b: 0 for b in bbs}
                 zero_outdegree = set()
                 for b in bbs:
-                    out_degree[b] += len(cls.bbs_graph[b])
+                    out_degree[b] += len(cls.bbs_graph.get(b, ()))
                 for b in bbs:
                     if out_degree[b] == 0:
                         zero_outdegree.add(b)
@@ -247,8 +266,9 @@ class Graph:
                 # construct edges from original exit points to the dummy end block
                 # and update class variables
                 for exit in zero_outdegree:
-                    cls.bbs_graph[exit][f"{EDGE_FALLTHROUGH}_0"] = dummy_end.name
-                cls.bbs_graph[dummy_end.name] = defaultdict(str)
+                    cls.bbs_graph.setdefault(exit, {})[
+                        f"{EDGE_FALLTHROUGH}_0"] = dummy_end.name
+                cls.bbs_graph[dummy_end.name] = {}
 
         def _remove_original_edge(bb_names, keep_original_edge_bbs):
             """
@@ -326,7 +346,7 @@ class Graph:
                     except ValueError:
                         callee_op = int(callee_op, 16)
                     callee_func_name = readable_internal_func_name(
-                        Configuration.get_func_index_to_func_name(), f"$func{callee_op}")
+                        Configuration._func_index_to_func_name, f"$func{callee_op}")
                     if is_modeled(callee_func_name):
                         continue
 
@@ -347,7 +367,7 @@ class Graph:
                         if possible_callee_type != target_callee_type:
                             continue
                         possible_callee_func_name = readable_internal_func_name(
-                            Configuration.get_func_index_to_func_name(), f"$func{possible_callee_op}")
+                            Configuration._func_index_to_func_name, f"$func{possible_callee_op}")
                         if is_modeled(possible_callee_func_name):
                             keep_original_edge_bbs.add(bb_name)
                             continue
@@ -377,16 +397,45 @@ class Graph:
         def init_rev_bbs_graph():
             for bb, edge_callee in cls.bbs_graph.items():
                 for edge, callee in edge_callee.items():
-                    if edge not in cls.rev_bbs_graph[callee]:
-                        cls.rev_bbs_graph[callee][edge] = bb
+                    rev_edge_caller = cls.rev_bbs_graph.setdefault(callee, {})
+                    if edge not in rev_edge_caller:
+                        rev_edge_caller[edge] = bb
                     else:
-                        cls.rev_bbs_graph[callee][
+                        rev_edge_caller[
                             f"fallthrough_{_find_max_fallthrough_edge_count(cls.rev_bbs_graph, callee)}"] = bb
 
             # for those zero indegree
             for bb in cls.bbs_graph.keys():
                 if bb not in cls.rev_bbs_graph:
-                    cls.rev_bbs_graph[bb] = defaultdict(str)
+                    cls.rev_bbs_graph[bb] = {}
+            # for those only pointed to: the functions unrelated to the entry
+            # are removed from the cfg, but their edges are kept, so their
+            # blocks only appear as edge ends. Let both graphs be indexable
+            # by any of them, as `intervals_gen` does
+            for bb in cls.rev_bbs_graph.keys():
+                if bb not in cls.bbs_graph:
+                    cls.bbs_graph[bb] = {}
+
+        def init_bbs_succ():
+            """
+            Freeze the successors of each basic block into a tuple, so that
+            the traversal does not iterate the nested dict on every visit
+            """
+            cls._bbs_succ = {bb: tuple(edge_callee.items())
+                             for bb, edge_callee in cls.bbs_graph.items()}
+
+        def init_bb_to_func():
+            """
+            initialize the func_entry_bb and bb_to_func, so that we do not
+            need to scan func_to_bbs to find out a block or a function
+            """
+            for func_name, bbs in cls.func_to_bbs.items():
+                entry_bb = next((bb for bb in bbs if bb.endswith('_0')), None)
+                # only the function to be analyzed requires an entry block
+                if entry_bb is not None:
+                    cls._func_entry_bb[func_name] = entry_bb
+                for bb in bbs:
+                    cls._bb_to_func[bb] = func_name
 
         cfg = cls.wasmVM.cfg
         init_func_to_bbs(cfg)
@@ -396,6 +445,8 @@ class Graph:
         init_dummy_blocks()
         link_dummy_blocks()
         init_rev_bbs_graph()
+        init_bbs_succ()
+        init_bb_to_func()
 
     def traverse(self):
         """
@@ -413,13 +464,15 @@ class Graph:
     @classmethod
     def bfs_producer(cls, queue):
         while len(queue) != 0:
-            yield queue.pop(0)
+            yield queue.popleft()
 
     @classmethod
     def random_producer(cls, queue):
         while len(queue) != 0:
             idx = random.randrange(0, len(queue))
-            yield queue.pop(idx)
+            item = queue[idx]
+            del queue[idx]
+            yield item
             
 
     @ classmethod
@@ -444,21 +497,20 @@ class Graph:
             state = cls.wasmVM.init_state(func, param_str)
             Configuration.set_entry_signature(entry_signature)
 
-        # retrieve all the relevant basic blocks
-        entry_func_bbs = cls.func_to_bbs[func]
-        # filter out the entry basic block and corresponding instructions
-        entry_bb = list(filter(lambda bb: bb[-2:] == '_0', entry_func_bbs))[0]
+        # the entry basic block of the function
+        entry_bb = cls.func_entry_bb.get(func)
+        assert entry_bb is not None, f"the function {func} has no entry basic block"
         blks = []
         for _, bbs in cls.func_to_bbs.items():
             blks += bbs
 
-        if Configuration.get_algo() == 'interval':
+        if Configuration._algo == 'interval':
             final_states = cls.algo_interval(entry_bb, state, blks)
-        elif Configuration.get_algo() == 'bfs':
+        elif Configuration._algo == 'bfs':
             final_states = cls.algo_traverse(entry_bb, state, cls.bfs_producer)
-        elif Configuration.get_algo() == 'dfs':
+        elif Configuration._algo == 'dfs':
             final_states = cls.algo_traverse(entry_bb, state, cls.dfs_producer)
-        elif Configuration.get_algo() == 'random':
+        elif Configuration._algo == 'random':
             final_states = cls.algo_traverse(entry_bb, state, cls.random_producer)
         else:
             raise Exception(
@@ -599,13 +651,19 @@ class Graph:
             while not que.empty():
                 yield que.get()
 
+        # bind the loop-invariant lookups to locals, as they are used for each visited block
+        bbs_succ, bb_to_instructions = cls.bbs_succ, cls.bb_to_instructions
+        emulate_basic_block, can_cut = cls.wasmVM.emulate_basic_block, cls.can_cut
+        func_index_to_func_name = Configuration._func_index_to_func_name
+        entry_func = Configuration._entry_func
+
         # @wrap_non_picklable_objects
         def consumer(item):
             score, state_id, (state, current_block, cur_head, vis, lvar) = item
             # init cur_head if it is not in lvar
             if cur_head not in lvar:
                 lvar[cur_head] = default_cons_prior.copy()
-            succs_list = cls.bbs_graph[current_block].items()
+            succs_list = bbs_succ[current_block]
             halt_flag = False
             """
             lis = []
@@ -617,14 +675,15 @@ class Graph:
             """
             # adopt DFS to traverse two intervals
             try:
-                emul_states = cls.wasmVM.emulate_basic_block(
-                    state, cls.bb_to_instructions[current_block], lvar[cur_head])
+                emul_states = emulate_basic_block(
+                    state, bb_to_instructions[current_block], lvar[cur_head])
             except ProcSuccessTermination:
                 # end of path
                 return False, state
             except ProcFailTermination as exit_code:
                 # trigger exit()
                 write_result(state[0], exit_code=exit_code)
+                state[0].discard_solver()
                 # remove terminated state (written out)
                 state = state[1:]
                 return False, state
@@ -636,12 +695,19 @@ class Graph:
             for edge_type, next_block in succs_list:
                 valid_state = list(
                     filter(
-                        lambda s: not cls.can_cut(
+                        lambda s: not can_cut(
                             edge_type, next_block, s,
                             lvar[cur_head]),
                         emul_states))
                 if len(valid_state) > 0:
                     avail_br[(edge_type, next_block)] = valid_state
+
+            # the states that cannot reach any successor are discarded
+            kept = {id(s) for valid_state in avail_br.values() for s in valid_state}
+            for s in emul_states:
+                if id(s) not in kept:
+                    s.discard_solver()
+
             # reset the following three indicator, as they are used
             # in can_cut and should be re-init
             for valid_state in avail_br.values():
@@ -691,9 +757,11 @@ class Graph:
                 # only the block that locates at the end of the entry function
                 # can be regarded as end of path
                 if readable_internal_func_name(
-                        Configuration.get_func_index_to_func_name(),
-                        item.current_func_name) == Configuration.get_entry():
+                        func_index_to_func_name,
+                        item.current_func_name) == entry_func:
                     write_result(item)
+                # the path ends here, its solver is no longer needed
+                item.discard_solver()
 
             final_states['return'].extend(emul_states)
             if halt_flag:
@@ -701,9 +769,8 @@ class Graph:
         return final_states
 
     @ classmethod
-    def sat_cut(cls, solver):
-        # TODO need cached here
-        return unsat == query_cache(solver)
+    def sat_cut(cls, state):
+        return unsat == query_cache(state)
 
     @ classmethod
     def can_cut(cls, edge_type, next_block, state, lvar=None):
@@ -712,7 +779,7 @@ class Graph:
         """
         if state.edge_type:
             not_same_edge = state.edge_type != edge_type
-            return not_same_edge or cls.sat_cut(state.solver)
+            return not_same_edge or cls.sat_cut(state)
 
         if state.call_indirect_callee:
             if not is_modeled(state.call_indirect_callee):
@@ -728,36 +795,32 @@ class Graph:
                 current_func = state.instr.cur_bb.split('_')[1]
                 next_block_func = next_block.split('_')[1]
                 not_same_func = current_func != next_block_func
-                return not_direct_succ or not_same_func or cls.sat_cut(
-                    state.solver)
+                return not_direct_succ or not_same_func or cls.sat_cut(state)
 
         if state.current_bb_name == '':
             # normal situation, check the current_func_name
             cur_func = state.current_func_name
-            for func, blks in cls.func_to_bbs.items():
-                if next_block in blks:
-                    break
+            func = cls.bb_to_func.get(next_block)
+            if func is None:
+                # the block is not owned by any function, thus not the current one
+                return True
             not_same_func = readable_internal_func_name(
-                Configuration.get_func_index_to_func_name(),
+                Configuration._func_index_to_func_name,
                 cur_func) != readable_internal_func_name(
-                Configuration.get_func_index_to_func_name(),
+                Configuration._func_index_to_func_name,
                 func)
 
-            return not_same_func or cls.sat_cut(state.solver)
+            return not_same_func or cls.sat_cut(state)
         else:
             # after restore_context, check the current_bb_name
             cur_bb = state.current_bb_name
-            for _, blks in cls.func_to_bbs.items():
-                try:
-                    cur_bb_index = blks.index(cur_bb)
-                except ValueError:
-                    continue
-
-                succ_block = blks[cur_bb_index + 1]
-                break
+            func = cls.bb_to_func.get(cur_bb)
+            assert func is not None, f"the basic block {cur_bb} does not belong to any function"
+            blks = cls.func_to_bbs[func]
+            succ_block = blks[blks.index(cur_bb) + 1]
 
             not_same_bb = succ_block != next_block
-            return not_same_bb or cls.sat_cut(state.solver)
+            return not_same_bb or cls.sat_cut(state)
 
     @ classmethod
     def aes_run_local(cls, lvar, blk):
@@ -828,7 +891,7 @@ class Graph:
 
     @ classmethod
     def algo_traverse(cls, entry, state, producer):
-        que = []
+        que = deque()
         que.append((entry, [state]))
         final_states = defaultdict(list)
         # icfg_cycles = set()
@@ -838,17 +901,24 @@ class Graph:
         # vis_start_bb.add(entry)
         # print(icfg_cycles)
 
+        # bind the loop-invariant lookups to locals, as they are used for each visited block
+        bbs_succ, bb_to_instructions = cls.bbs_succ, cls.bb_to_instructions
+        emulate_basic_block, can_cut = cls.wasmVM.emulate_basic_block, cls.can_cut
+        func_index_to_func_name = Configuration._func_index_to_func_name
+        entry_func = Configuration._entry_func
+
         def consumer(item):
             (current_bb, current_states) = item
-            succs_list = cls.bbs_graph[current_bb].items()
+            succs_list = bbs_succ[current_bb]
             halt_flag = False
             try:
-                emul_states = cls.wasmVM.emulate_basic_block(
-                    current_states, cls.bb_to_instructions[current_bb])
+                emul_states = emulate_basic_block(
+                    current_states, bb_to_instructions[current_bb])
             except ProcSuccessTermination:
                 return False, current_states
             except ProcFailTermination as exit_code:
                 write_result(current_states[0], exit_code=exit_code)
+                current_states[0].discard_solver()
                 # remove terminated state (written out)
                 current_states = current_states[1:]
                 return False, current_states
@@ -863,9 +933,15 @@ class Graph:
                 #     cls.find_cycles(next_block, icfg_cycles)
                 valid_states = list(
                     filter(
-                        lambda s: not cls.can_cut(edge_type, next_block, s), emul_states))
+                        lambda s: not can_cut(edge_type, next_block, s), emul_states))
                 if len(valid_states) > 0:
                     avail_br[(edge_type, next_block)] = valid_states
+
+            # the states that cannot reach any successor are discarded
+            kept = {id(s) for valid_states in avail_br.values() for s in valid_states}
+            for s in emul_states:
+                if id(s) not in kept:
+                    s.discard_solver()
             
             for valid_states in avail_br.values():
                 for s in valid_states:
@@ -886,9 +962,11 @@ class Graph:
                 # only the block that locates at the end of the entry function
                 # can be regarded as end of path
                 if readable_internal_func_name(
-                        Configuration.get_func_index_to_func_name(),
-                        item.current_func_name) == Configuration.get_entry():
+                        func_index_to_func_name,
+                        item.current_func_name) == entry_func:
                     write_result(item)
+                # the path ends here, its solver is no longer needed
+                item.discard_solver()
 
             final_states['return'].extend(emul_states)
             if halt_flag:
@@ -30,6 +30,8 @@ class WasmInstruction(Instruction):
             # specific interpretation of operand value
         self.operand_interpretation = operand_interpretation
         self.insn_byte = insn_byte
+        # see `group`
+        self._group = None
         self.pops = pops
         self.pushes = pushes
         self.imm_struct = imm_struct
@@ -62,6 +64,12 @@ class WasmInstruction(Instruction):
     @property
     def group(self):
         """ Instruction classification per group """
+        # it is looked up each time the instruction is emulated, thus cached
+        if self._group is None:
+            self._group = self._classify()
+        return self._group
+
+    def _classify(self):
         last_class = _groups.get(0)
         for k, v in _groups.items():
             if self.opcode >= k:
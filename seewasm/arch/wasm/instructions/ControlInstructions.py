@@ -36,7 +36,7 @@ class ControlInstructions:
         3. assign popped elements in step 1 in local, change the current_func_name
         """
         logging.info(
-            f"Call: {readable_internal_func_name(Configuration.get_func_index_to_func_name(), state.current_func_name)} -> {callee_func_name}")
+            f"Call: {readable_internal_func_name(Configuration._func_index_to_func_name, state.current_func_name)} -> {callee_func_name}")
 
         # step 1
         num_arg = 0
@@ -79,7 +79,7 @@ class ControlInstructions:
         caller_func_name, cur_bb, stack, local, require_return = state.context_stack.pop()
 
         logging.info(
-            f"Return: {readable_internal_func_name(Configuration.get_func_index_to_func_name(), state.current_func_name)}")
+            f"Return: {readable_internal_func_name(Configuration._func_index_to_func_name, state.current_func_name)}")
 
         # step 1
         if require_return:
@@ -101,9 +101,9 @@ class ControlInstructions:
         callee_func_name, param_str, return_str, _ = target_func
 
         readable_callee_func_name = readable_internal_func_name(
-            Configuration.get_func_index_to_func_name(),
+            Configuration._func_index_to_func_name,
             callee_func_name)
-        if Configuration.get_dsl_flag() and readable_callee_func_name.startswith("checker"):
+        if Configuration._dsl_flag and readable_callee_func_name.startswith("checker"):
             # if it is a instrumented function
             idx = int(readable_callee_func_name.split('$')[1])
             """
@@ -119,14 +119,14 @@ class ControlInstructions:
                 lvar['prior'] = abs(3 - lvar['rounds_j'])
             """
             states = [state]
-        elif Configuration.get_source_type() == 'c' and is_modeled(readable_callee_func_name, specify_lang='c'):
+        elif Configuration._source_type == 'c' and is_modeled(readable_callee_func_name, specify_lang='c'):
             func = CPredefinedFunction(
                 readable_callee_func_name, state.current_func_name)
             states = log_in_out(
                 readable_callee_func_name, "C Library")(
                 func.emul)(
                 state, param_str, return_str, data_section, analyzer)
-        elif Configuration.get_source_type() == 'go' and is_modeled(readable_callee_func_name, specify_lang='go'):
+        elif Configuration._source_type == 'go' and is_modeled(readable_callee_func_name, specify_lang='go'):
             # TODO Go library func modeling is not tested
             func = GoPredefinedFunction(
                 readable_callee_func_name, state.current_func_name)
@@ -134,7 +134,7 @@ class ControlInstructions:
                 readable_callee_func_name, "Go Library")(
                 func.emul)(
                 state, param_str, return_str, data_section, analyzer)
-        elif Configuration.get_source_type() == 'rust' and is_modeled(readable_callee_func_name, specify_lang='rust'):
+        elif Configuration._source_type == 'rust' and is_modeled(readable_callee_func_name, specify_lang='rust'):
             # TODO may model some rust library funcs
             pass
         # if the callee is imported (WASI)
@@ -187,9 +187,9 @@ class ControlInstructions:
             elif not is_true(op) and not is_false(op):
                 # these two flags are used to jump over unnecessary deepcopy
                 no_need_true, no_need_false = False, False
-                if unsat == one_time_query_cache(state.solver, op):
+                if unsat == one_time_query_cache(state, op):
                     no_need_true = True
-                if unsat == one_time_query_cache(state.solver, Not(op)):
+                if unsat == one_time_query_cache(state, Not(op)):
                     no_need_false = True
 
                 if no_need_true and no_need_false:
@@ -198,21 +198,21 @@ class ControlInstructions:
                     new_state = copy.deepcopy(state)
                     # conditional_true
                     state.edge_type = 'conditional_true_0'
-                    state.solver.add(op)
+                    state.add_constraint(op)
                     # conditional_false
                     new_state.edge_type = 'conditional_false_0'
-                    new_state.solver.add(Not(op))
+                    new_state.add_constraint(Not(op))
                     # append
                     states.append(state)
                     states.append(new_state)
                 else:
                     if no_need_true:
                         state.edge_type = 'conditional_false_0'
-                        state.solver.add(Not(op))
+                        state.add_constraint(Not(op))
                         states.append(state)
                     else:
                         state.edge_type = 'conditional_true_0'
-                        state.solver.add(op)
+                        state.add_constraint(op)
                         states.append(state)
             else:
                 exit(f"br_if/if instruction error. op is {op}")
@@ -221,7 +221,7 @@ class ControlInstructions:
         elif self.instr_name == 'call_indirect':
             # refer to: https://developer.mozilla.org/en-US/docs/WebAssembly/Understanding_the_text_format#webassembly_tables
             # this instruction will pop an element out of the stack, and use this as an index in the table, i.e., elem section in Wasm module, to dynamically determine which fucntion will be invoked
-            elem_index_to_func = Configuration.get_elem_index_to_func()
+            elem_index_to_func = Configuration._elem_index_to_func
 
             # target function index
             op = state.symbolic_stack.pop()
@@ -235,7 +235,7 @@ class ControlInstructions:
             callee_func_offset = -1
             for func_offset, item in enumerate(analyzer.func_prototypes):
                 if callee_func_name == readable_internal_func_name(
-                        Configuration.get_func_index_to_func_name(),
+                        Configuration._func_index_to_func_name,
                         item[0]):
                     state.call_indirect_callee = callee_func_name
                     callee_func_offset = func_offset
@@ -275,7 +275,7 @@ class ControlInstructions:
                 else:
                     # we have to query z3
                     new_state = copy.deepcopy(state)
-                    new_state.solver.add(cond)
+                    new_state.add_constraint(cond)
                     new_state.edge_type = f"conditional_true_{target}"
                     states.append(new_state)
 
@@ -288,7 +288,7 @@ class ControlInstructions:
                 state.edge_type = "conditional_false_0"
                 states.append(state)
             else:
-                state.solver.add(cond)
+                state.add_constraint(cond)
                 state.edge_type = "conditional_false_0"
                 states.append(state)
 
@@ -34,9 +34,9 @@ class ParametricInstructions:
             elif not is_true(op) and not is_false(op):
                 # these two flags are used to jump over unnecessary deepcopy
                 no_need_true, no_need_false = False, False
-                if unsat == one_time_query_cache(state.solver, op):
+                if unsat == one_time_query_cache(state, op):
                     no_need_true = True
-                if unsat == one_time_query_cache(state.solver, Not(op)):
+                if unsat == one_time_query_cache(state, Not(op)):
                     no_need_false = True
 
                 if no_need_true and no_need_false:
@@ -44,19 +44,19 @@ class ParametricInstructions:
                 elif not no_need_true and not no_need_false:
                     new_state = deepcopy(state)
 
-                    state.solver.add(op)
+                    state.add_constraint(op)
                     state.symbolic_stack.append(arg1)
 
-                    new_state.solver.add(Not(op))
+                    new_state.add_constraint(Not(op))
                     new_state.symbolic_stack.append(arg2)
 
                     return [state, new_state]
                 else:
                     if no_need_true:
-                        state.solver.add(Not(op))
+                        state.add_constraint(Not(op))
                         state.symbolic_stack.append(arg2)
                     else:
-                        state.solver.add(op)
+                        state.add_constraint(op)
                         state.symbolic_stack.append(arg1)
                     return [state]
             else:
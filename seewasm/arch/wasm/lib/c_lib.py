@@ -1,5 +1,6 @@
 import logging
 import math
+from collections import deque
 
 from seewasm.arch.wasm.configuration import Configuration
 from seewasm.arch.wasm.exceptions import (ProcFailTermination,
@@ -119,9 +120,10 @@ class CPredefinedFunction:
             if 'r' in mode:
                 _, length_limit = Configuration.get_sym_file_limits()
                 content = BitVec(filename, length_limit * 8)
-                state.file_sys[open_file_fd]["content"] = [
+                # it is consumed from the left, see fd_read in wasi.py
+                state.file_sys[open_file_fd]["content"] = deque(
                     Extract(i * 8 - 1, (i - 1) * 8, content)
-                    for i in range(length_limit, 0, -1)]
+                    for i in range(length_limit, 0, -1))
             elif 'w' in mode:
                 state.file_sys[open_file_fd]["content"] = []
             else:
@@ -148,7 +150,7 @@ class CPredefinedFunction:
                 offset = analyzer.elements[0]['offset']
                 fp_func = '$func' + str(possible_callee[stream - offset])
                 fp_func = readable_internal_func_name(
-                    Configuration.get_func_index_to_func_name(), fp_func)
+                    Configuration._func_index_to_func_name, fp_func)
                 if fp_func == '__stdio_write':
                     logging.info(f"\tthe vfprintf points to {fp_func}")
                     fp = 1
@@ -430,7 +432,7 @@ def find_elem_index(func_name, ana):
     offset = ana.elements[0]['offset']
     for i, elem in enumerate(ana.elements[0]["elems"]):
         if func_name == readable_internal_func_name(
-                Configuration.get_func_index_to_func_name(),
+                Configuration._func_index_to_func_name,
                 "$func" + str(elem)):
             return i + offset
     exit(
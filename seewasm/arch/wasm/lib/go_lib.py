@@ -134,7 +134,7 @@ class GoPredefinedFunction:
 
                     # find the index of runtime.alloc
                     runtime_alloc_ind = -1
-                    for ind, name in Configuration.get_func_index_to_func_name().items():
+                    for ind, name in Configuration._func_index_to_func_name.items():
                         if name == 'runtime.alloc':
                             runtime_alloc_ind = ind
                     assert runtime_alloc_ind != -1
@@ -236,24 +236,26 @@ class GoPredefinedFunction:
         elif self.name == 'runtime.divideByZeroPanic':
             # Not(If(scanf_symbol == 0, 1, 0) == 0)
             divisor = None
-            constraint = simplify(state.solver.assertions()[-1])
-            # match the condition
-            # Not -> == -> If --arg0--> condition
-            if is_not(constraint) and \
-                    is_eq(constraint.arg(0)) and \
-                    is_const(constraint.arg(0).arg(1)) and \
-                    constraint.arg(0).arg(1).as_long() == 0 and \
-                    constraint.arg(0).arg(0).decl().kind() == Z3_OP_ITE and \
-                    is_const(constraint.arg(0).arg(0).arg(1)) and constraint.arg(0).arg(0).arg(1).as_long() == 1 and \
-                    is_const(constraint.arg(0).arg(0).arg(2)) and constraint.arg(0).arg(0).arg(2).as_long() == 0 and \
-                    is_eq(constraint.arg(0).arg(0).arg(0)) and \
-                    is_const(constraint.arg(0).arg(0).arg(0).arg(1)) and constraint.arg(0).arg(0).arg(0).arg(1).as_long() == 0:
-                # get divisor
-                divisor = constraint.arg(0).arg(0).arg(0).arg(0)
-            # scanf_symbol == 0
-            elif is_eq(constraint) and \
-                    is_const(constraint.arg(1)) and constraint.arg(1).as_long() == 0:
-                divisor = constraint.arg(0)
+            # the latest constraint is the branch condition, if there is any
+            if state.constraints is not None:
+                constraint = simplify(state.constraints.constraint)
+                # match the condition
+                # Not -> == -> If --arg0--> condition
+                if is_not(constraint) and \
+                        is_eq(constraint.arg(0)) and \
+                        is_const(constraint.arg(0).arg(1)) and \
+                        constraint.arg(0).arg(1).as_long() == 0 and \
+                        constraint.arg(0).arg(0).decl().kind() == Z3_OP_ITE and \
+                        is_const(constraint.arg(0).arg(0).arg(1)) and constraint.arg(0).arg(0).arg(1).as_long() == 1 and \
+                        is_const(constraint.arg(0).arg(0).arg(2)) and constraint.arg(0).arg(0).arg(2).as_long() == 0 and \
+                        is_eq(constraint.arg(0).arg(0).arg(0)) and \
+                        is_const(constraint.arg(0).arg(0).arg(0).arg(1)) and constraint.arg(0).arg(0).arg(0).arg(1).as_long() == 0:
+                    # get divisor
+                    divisor = constraint.arg(0).arg(0).arg(0).arg(0)
+                # scanf_symbol == 0
+                elif is_eq(constraint) and \
+                        is_const(constraint.arg(1)) and constraint.arg(1).as_long() == 0:
+                    divisor = constraint.arg(0)
             func_ind = get_func_index_from_state(analyzer, state)
             func_offset = state.instr.offset
             import datetime
@@ -28,7 +28,7 @@ def is_modeled(func_name, specify_lang=None):
     if specify_lang:
         return func_name in MODELED_FUNCS[specify_lang]
     else:
-        return func_name in MODELED_FUNCS['wasi'] or func_name in MODELED_FUNCS[Configuration.get_source_type()]
+        return func_name in MODELED_FUNCS['wasi'] or func_name in MODELED_FUNCS[Configuration._source_type]
 
 
 def _extract_params(param_str, state):
@@ -146,7 +146,7 @@ class WASIImportFunction:
                     #     state.solver.add(
                     #         And(the_char >= 33, the_char <= 126))
 
-                    state.solver.add(arg != 0)
+                    state.add_constraint(arg != 0)
                     num_arg_bytes = arg.size() // 8 + 1
                     # insert the arg
                     _storeN(state, next_arg_buf_addr, arg, num_arg_bytes - 1)
@@ -291,7 +291,7 @@ class WASIImportFunction:
                 stdin_length = len(state.file_sys[fd]["content"])
 
                 for j in range(min(stdin_length, buffer_len)):
-                    data_to_read = state.file_sys[fd]["content"].pop(0)
+                    data_to_read = state.file_sys[fd]["content"].popleft()
                     out_chars.append(data_to_read)
                     char_read_cnt += 1
                     _storeN(state, buffer_ptr + j, data_to_read, 1)
@@ -334,7 +334,7 @@ class WASIImportFunction:
                 if is_bv(data_len):
                     tmp_data_len = BitVec('tmp_data_len', data_len.size())
 
-                    state.solver.add(tmp_data_len == data_len)
+                    state.add_constraint(tmp_data_len == data_len)
                     if sat == state.solver.check():
                         m = state.solver.model()
                         data_len = m[tmp_data_len].as_long()
@@ -359,7 +359,7 @@ class WASIImportFunction:
                 f"\tproc_exit: return_val: {return_val}")
 
             proc_exit = BitVec('proc_exit', 32)
-            state.solver.add(proc_exit == return_val)
+            state.add_constraint(proc_exit == return_val)
             if return_val == 0:
                 raise ProcSuccessTermination(return_val)
             else:
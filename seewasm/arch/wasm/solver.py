@@ -1,3 +1,5 @@
+from threading import Lock
+
 from z3 import Solver
 
 # from lab_solver import *
@@ -9,3 +11,38 @@ class SMTSolver:
             return Solver()
         else:
             raise Exception("No SMT backend found")
+
+
+# the solvers given back by the discarded states, see `acquire_solver`
+_solver_pool = []
+# at most these many idle solvers are kept, the others are dropped
+SOLVER_POOL_LIMIT = 64
+_solver_pool_lock = Lock()
+
+
+def acquire_solver(designated_solver):
+    """
+    Take a solver from the pool, or construct one if the pool is empty.
+
+    The solver is handed out with a new scope pushed, thus releasing it only
+    pops the assertions in that scope. Reusing a solver this way is much
+    cheaper than a new one, which is set up on its first assertion.
+    """
+    with _solver_pool_lock:
+        solver = _solver_pool.pop() if _solver_pool else None
+    if solver is None:
+        solver = SMTSolver(designated_solver)
+    solver.push()
+    return solver
+
+
+def release_solver(solver):
+    """
+    Drop the assertions of a solver got from `acquire_solver`, and put it back
+    into the pool if it is not full. The solver should not be used by the
+    caller anymore.
+    """
+    solver.pop()
+    with _solver_pool_lock:
+        if len(_solver_pool) < SOLVER_POOL_LIMIT:
+            _solver_pool.append(solver)
@@ -251,58 +251,87 @@ def log_in_out(func_name, directory):
     return decorator
 
 
-def query_cache(solver):
+def query_cache_key(constraints):
     """
-    Check is assertions in solver are cached.
-    If they are, return directly, or update the cache and return
+    Construct the key of `_z3_cache_dict` from the given constraints.
+    The key is irrelevant to the order and the duplication of constraints
     """
-    cons_hash_set = {hash(c) for c in solver.assertions()}
-    cons_hash_list = list(cons_hash_set)
-    cons_hash_list.sort()
-    cons_hash_tuple = tuple(cons_hash_list)
-
-    if cons_hash_tuple not in Configuration._z3_cache_dict:
-        solver_check_result = solver.check()
-
-        # try to terminate invalid-memory in advance
-        if solver_check_result == sat:
-            m = solver.model()
-            for k in m:
-                if str(k) == 'invalid-memory':
-                    Configuration._z3_cache_dict[cons_hash_tuple] = unsat
-                    raise ProcFailTermination(INVALIDMEMORY)
-
-        Configuration._z3_cache_dict[cons_hash_tuple] = solver_check_result
-    else:
-        solver_check_result = Configuration._z3_cache_dict[cons_hash_tuple]
+    return frozenset(hash(c) for c in constraints)
+
+
+def _check_and_cache(solver, cons_key):
+    """
+    Check the solver, and store the result in cache with the given key
+    """
+    solver_check_result = solver.check()
 
+    # try to terminate invalid-memory in advance
+    if solver_check_result == sat:
+        m = solver.model()
+        for k in m:
+            if str(k) == 'invalid-memory':
+                Configuration._z3_cache_dict[cons_key] = unsat
+                raise ProcFailTermination(INVALIDMEMORY)
+
+    Configuration._z3_cache_dict[cons_key] = solver_check_result
     return solver_check_result
 
 
-def one_time_query_cache(solver, con):
+def query_cache(state):
+    """
+    Check is constraints of the state are cached.
+    If they are, return directly, or update the cache and return.
+    The state's solver is only built when the query is not cached.
+    """
+    cons_key = query_cache_key(state.constraints or [])
+
+    solver_check_result = Configuration._z3_cache_dict.get(cons_key)
+    if solver_check_result is None:
+        solver_check_result = _check_and_cache(state.solver, cons_key)
+
+    return solver_check_result
+
+
+def one_time_query_cache(state, con):
     """
     the *args are received constraints, they will not be inserted into the solver.
     It is an one-time query
     """
-    solver.push()
-    solver.add(con)
-    solver_check_result = query_cache(solver)
-    solver.pop()
+    cons_key = query_cache_key(list(state.constraints or []) + [con])
+
+    # only touch the solver if the query is not cached
+    solver_check_result = Configuration._z3_cache_dict.get(cons_key)
+    if solver_check_result is None:
+        solver = state.solver
+        solver.push()
+        try:
+            solver.add(con)
+            solver_check_result = _check_and_cache(solver, cons_key)
+        finally:
+            solver.pop()
 
     return solver_check_result
 
 
+# the solver shared by all one-time queries, each query is wrapped in push/pop
+# so that we do not construct a brand new solver for each of them
+_one_time_solver = None
+
+
 def one_time_query_cache_without_solver(con):
-    cons_hash_set = set([hash(c) for c in [con]])
-    cons_hash_list = list(cons_hash_set)
-    cons_hash_list.sort()
-    cons_hash_tuple = tuple(cons_hash_list)
-    if cons_hash_tuple not in Configuration._z3_cache_dict:
-        s = SMTSolver(Configuration.get_solver())
-        s.add(con)
-        solver_check_result = s.check()
-        Configuration._z3_cache_dict[cons_hash_tuple] = solver_check_result
-    else:
-        solver_check_result = Configuration._z3_cache_dict[cons_hash_tuple]
+    global _one_time_solver
+
+    cons_key = query_cache_key([con])
+    solver_check_result = Configuration._z3_cache_dict.get(cons_key)
+    if solver_check_result is None:
+        if _one_time_solver is None:
+            _one_time_solver = SMTSolver(Configuration._solver)
+        _one_time_solver.push()
+        try:
+            _one_time_solver.add(con)
+            solver_check_result = _one_time_solver.check()
+        finally:
+            _one_time_solver.pop()
+        Configuration._z3_cache_dict[cons_key] = solver_check_result
 
     return solver_check_result
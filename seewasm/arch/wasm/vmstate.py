@@ -2,14 +2,61 @@
 from collections import defaultdict
 
 from seewasm.arch.wasm.configuration import Configuration
-from seewasm.arch.wasm.solver import SMTSolver
+from seewasm.arch.wasm.solver import acquire_solver, release_solver
 from seewasm.arch.wasm.utils import (init_file_for_file_sys,
                                      readable_internal_func_name)
 from seewasm.engine.engine import VMstate
-from z3 import BitVecVal
+from z3 import BitVecVal, is_true
+
+
+class ConstraintList:
+    """
+    An immutable, persistent list of constraints.
+
+    Each node keeps the newest constraint and refers to its parent, thus the
+    forked states share the common prefix of their constraints and a fork
+    only costs O(1). `None` stands for the empty list.
+    """
+    __slots__ = ('parent', 'constraint', '_len')
+
+    def __init__(self, parent, constraint):
+        self.parent = parent
+        self.constraint = constraint
+        self._len = 1 if parent is None else parent._len + 1
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def to_list(self):
+        """
+        Return the constraints from the oldest to the newest.
+        Nothing is cached on the nodes, thus the forks only share the nodes.
+        """
+        return self.latest(self._len)
+
+    def latest(self, n):
+        """
+        Return the newest n constraints, from the older to the newer
+        """
+        result = []
+        node = self
+        for _ in range(n):
+            result.append(node.constraint)
+            node = node.parent
+        result.reverse()
+        return result
 
 
 class WasmVMstate(VMstate):
+    __slots__ = ('symbolic_stack', 'symbolic_memory', 'local_var', 'globals',
+                 'instr', 'current_func_name', 'current_bb_name',
+                 'sign_mapping', 'context_stack', 'args', 'file_sys',
+                 'edge_type', 'constraints', '_solver', '_solver_len',
+                 '_solver_ids', 'call_indirect_callee')
+
     def __init__(self):
         # data structure:
         def local_default():
@@ -24,8 +71,8 @@ class WasmVMstate(VMstate):
         self.current_func_name = ''
         # current basic block's name, used in recursive process
         self.current_bb_name = ''
-        # keep the operator and its speculated sign
-        self.sign_mapping = defaultdict(bool)
+        # keep the operator and its speculated sign, a missing one is False
+        self.sign_mapping = {}
         # context stack
         # whose element is 4-tuple: (func_name, stack, local, require_return)
         # TODO files buffer may need to maintained in context
@@ -49,18 +96,69 @@ class WasmVMstate(VMstate):
 
         # used by br_if instruction
         self.edge_type = ''
-        # the corresponding solver
-        self.solver = SMTSolver(Configuration.get_solver())
+        # the constraints of the current path, see `ConstraintList`
+        self.constraints = None
+        # the corresponding solver, lazily built from the constraints
+        self._solver = None
+        # how many constraints have been synchronized into the `_solver`
+        self._solver_len = 0
+        # the ids of the constraints in the `_solver`, to skip the duplicated
+        self._solver_ids = set()
         # the name of function that is called in call_indirect
         self.call_indirect_callee = ''
 
     def __str__(self):
-        return f'''Current Func:\t{readable_internal_func_name(Configuration.get_func_index_to_func_name(), self.current_func_name)}
+        return f'''Current Func:\t{readable_internal_func_name(Configuration._func_index_to_func_name, self.current_func_name)}
 Stack:\t\t{self.symbolic_stack}
 Local Var:\t{self.local_var}
 Global Var:\t{self.globals}
 Memory:\t\t{self.symbolic_memory}
-Constraints:\t{self.solver.assertions()}\n'''
+Constraints:\t{self.constraints.to_list() if self.constraints else []}\n'''
+
+    @property
+    def solver(self):
+        """
+        The SMT solver that holds all constraints of the state.
+
+        It is built lazily and synchronized with `constraints` incrementally,
+        thus new constraints should be added by `add_constraint` rather than
+        by adding them into the solver directly.
+        """
+        if self._solver is None:
+            self._solver = acquire_solver(Configuration._solver)
+            self._solver_len = 0
+            self._solver_ids = set()
+        cons_len = len(self.constraints) if self.constraints else 0
+        if self._solver_len < cons_len:
+            # a constraint may be added repeatedly, e.g., in a loop
+            solver_ids = self._solver_ids
+            new_constraints = []
+            for c in self.constraints.latest(cons_len - self._solver_len):
+                c_id = c.get_id()
+                if c_id not in solver_ids:
+                    solver_ids.add(c_id)
+                    new_constraints.append(c)
+            if new_constraints:
+                self._solver.add(*new_constraints)
+            self._solver_len = cons_len
+        return self._solver
+
+    def add_constraint(self, constraint):
+        # a trivially true constraint makes no difference
+        if is_true(constraint):
+            return
+        self.constraints = ConstraintList(self.constraints, constraint)
+
+    def discard_solver(self):
+        """
+        Give the solver back to the pool once the state is discarded.
+        It will be rebuilt if the state is queried again.
+        """
+        if self._solver is not None:
+            release_solver(self._solver)
+            self._solver = None
+            self._solver_len = 0
+            self._solver_ids = set()
 
     def details(self):
         raise NotImplementedError
@@ -68,5 +166,46 @@ Constraints:\t{self.solver.assertions()}\n'''
     def __lt__(self, other):
         return False
 
+    def __deepcopy__(self, memo):
+        """
+        Fork the state.
+
+        Only the containers that will be modified in place are copied, the
+        z3 expressions inside them and the constraints are immutable, thus
+        they are shared between states.
+        """
+        new_state = WasmVMstate.__new__(WasmVMstate)
+        new_state.symbolic_stack = self.symbolic_stack.copy()
+        new_state.symbolic_memory = self.symbolic_memory.copy()
+        new_state.local_var = self.local_var.copy()
+        new_state.globals = self.globals.copy()
+        new_state.instr = self.instr
+        new_state.current_func_name = self.current_func_name
+        new_state.current_bb_name = self.current_bb_name
+        new_state.sign_mapping = self.sign_mapping.copy()
+        # the stack and local in each context will be restored and modified later
+        new_state.context_stack = [
+            (func_name, bb_name, stack.copy(), local.copy(), require_return)
+            for func_name, bb_name, stack, local, require_return in self.context_stack]
+        new_state.args = self.args[:]
+        new_state.file_sys = {}
+        for fd, file_info in self.file_sys.items():
+            new_file_info = file_info.copy()
+            new_file_info["content"] = file_info["content"].copy()
+            new_state.file_sys[fd] = new_file_info
+        new_state.edge_type = self.edge_type
+        # the constraints are shared, and the solver will be rebuilt on demand
+        new_state.constraints = self.constraints
+        new_state._solver = None
+        new_state._solver_len = 0
+        new_state._solver_ids = set()
+        new_state.call_indirect_callee = self.call_indirect_callee
+        memo[id(self)] = new_state
+        return new_state
+
     def __getstate__(self):
-        return self.__dict__.copy()
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
@@ -2,6 +2,10 @@ from binascii import unhexlify
 
 
 def bytecode_to_bytes(bytecode):
+    # already bytes-like, avoid the copy
+    if isinstance(bytecode, (bytes, bytearray, memoryview)):
+        return bytecode
+
     if str(bytecode).startswith("0x"):
         bytecode = bytecode[2:]
 
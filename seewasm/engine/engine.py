@@ -1,4 +1,5 @@
 class VMstate(object):
+    __slots__ = ()
 
     def __init__(self, gas=1000000):
         """ TODO """
@@ -4,6 +4,12 @@ import os
 import pytest
 import subprocess
 import sys
+from copy import deepcopy
+
+from z3 import BitVec
+
+from seewasm.arch.wasm.utils import query_cache_key
+from seewasm.arch.wasm.vmstate import WasmVMstate
 
 testcase_dir = './test/'
 
@@ -97,4 +103,47 @@ def test_password_sym_args():
             assert analyzed_stdout == "Password found!\n", f'output mismatched, got {analyzed_stdout}'
         else:
             assert 'Status' in state, f'no Status found in {state}'
-            assert state['Status'] == "Exit with status code 1", f'should exit with status code 1, got {state["Status"]}'
\ No newline at end of file
+            assert state['Status'] == "Exit with status code 1", f'should exit with status code 1, got {state["Status"]}'
+
+def test_pooled_solver_starts_empty():
+    x = BitVec('x', 32)
+    state = WasmVMstate()
+    state.add_constraint(x > 1)
+    forked = deepcopy(state)
+    forked.add_constraint(x < 0)
+    assert len(forked.solver.assertions()) == 2, f'got {forked.solver.assertions()}'
+
+    pooled = forked.solver
+    forked.discard_solver()
+    other = WasmVMstate()
+    assert other.solver is pooled, 'the discarded solver should be reused'
+    assert len(other.solver.assertions()) == 0, f'leaked assertions: {other.solver.assertions()}'
+    other.discard_solver()
+
+def test_forked_states_keep_their_own_constraints():
+    x = BitVec('x', 32)
+    state = WasmVMstate()
+    state.add_constraint(x > 1)
+    state.add_constraint(x > 1)
+    assert len(state.solver.assertions()) == 1, 'duplicated constraint should be added into the solver once'
+
+    forked = deepcopy(state)
+    state.add_constraint(x < 5)
+    forked.add_constraint(x > 10)
+    assert state.constraints.parent is forked.constraints.parent, 'forks should share the common prefix'
+    assert [str(c) for c in state.constraints] == ['x > 1', 'x > 1', 'x < 5']
+    assert [str(c) for c in forked.constraints] == ['x > 1', 'x > 1', 'x > 10']
+    assert sorted(str(c) for c in state.solver.assertions()) == ['x < 5', 'x > 1']
+    assert sorted(str(c) for c in forked.solver.assertions()) == ['x > 1', 'x > 10']
+
+    # the solver is rebuilt from the constraints after being discarded
+    forked.discard_solver()
+    forked.add_constraint(x < 20)
+    assert sorted(str(c) for c in forked.solver.assertions()) == ['x < 20', 'x > 1', 'x > 10']
+    state.discard_solver()
+    forked.discard_solver()
+
+def test_query_cache_key_ignores_order_and_duplication():
+    x = BitVec('x', 32)
+    assert query_cache_key([x > 1, x < 5]) == query_cache_key([x < 5, x > 1, x > 1])
+    assert query_cache_key([x > 1]) != query_cache_key([x > 1, x < 5])